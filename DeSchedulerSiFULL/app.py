@@ -3,34 +3,68 @@ Disk Scheduling Simulator
 Flask Web Application for Demonstrating Operating System Disk Scheduling
 """
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for
+from flask import Flask, render_template, request, jsonify, redirect, url_for, Response, stream_with_context
+from flask.json.provider import JSONProvider
 import sqlite3
 import os
+import threading
+from functools import lru_cache
+from itertools import starmap
 from datetime import datetime
-from disk_scheduler import (
-    DiskRequest,
-    fcfs_disk_scheduling,
-    sstf_disk_scheduling,
-    scan_disk_scheduling,
-    c_scan_disk_scheduling,
-    look_disk_scheduling,
-    c_look_disk_scheduling
-)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from disk_scheduler import DiskRequest, DISK_ALGORITHMS, run_disk_scheduler
 
 # Initialize Flask application
 app = Flask(__name__)
 app.secret_key = os.environ.get('SESSION_SECRET', 'dev-secret-key')
 
+class OrjsonProvider(JSONProvider):
+    # Encodes responses in C; used only when orjson is installed
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
 # Database configuration
 DATABASE = 'disk_scheduler.db'
-
-def get_db_connection():
-    conn = sqlite3.connect(DATABASE)
-    conn.row_factory = sqlite3.Row
-    return conn
+# Request IDs checked per query by the bulk endpoint (older SQLite builds allow 999 parameters)
+BULK_LOOKUP_CHUNK = 900
+# Largest value a SQLite INTEGER column can store; bigger ints make sqlite3 raise OverflowError
+SQLITE_INTEGER_MAX = 2**63 - 1
+
+# Algorithms in DISK_ALGORITHMS that take a sweep direction; the rest ignore it
+DIRECTIONAL_ALGORITHMS = frozenset(['scan', 'look'])
+
+# Connections are kept per thread and reused across requests, so the
+# sqlite3 prepared-statement cache stays warm instead of starting cold
+# (re-parsing every statement) on a fresh connection each request
+_local = threading.local()
+
+def get_db():
+    db = getattr(_local, 'db', None)
+    if db is None:
+        db = _local.db = sqlite3.connect(DATABASE)
+        db.execute('PRAGMA synchronous=NORMAL')
+    return db
+
+@app.teardown_appcontext
+def release_db(exception):
+    # Never carry an unfinished transaction over into the next request
+    db = getattr(_local, 'db', None)
+    if db is not None and db.in_transaction:
+        db.rollback()
 
 def init_database():
-    conn = get_db_connection()
+    conn = get_db()
+    # WAL is persistent in the database file, so it only needs setting once
+    conn.execute('PRAGMA journal_mode=WAL')
     conn.execute('''
         CREATE TABLE IF NOT EXISTS disk_requests (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -40,8 +74,21 @@ def init_database():
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     ''')
+    # Lets ORDER BY arrival_time, request_id read rows in index order instead of sorting
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_disk_requests_arrival ON disk_requests (arrival_time, request_id)')
+    # Single-row counter bumped by triggers on every change to disk_requests.
+    # Kept in the database so every worker process sees the same version.
+    conn.execute('CREATE TABLE IF NOT EXISTS data_version (version INTEGER NOT NULL)')
+    conn.execute('INSERT INTO data_version (version) SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM data_version)')
+    for event in ['INSERT', 'UPDATE', 'DELETE']:
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS disk_requests_{event.lower()}_version
+            AFTER {event} ON disk_requests
+            BEGIN
+                UPDATE data_version SET version = version + 1;
+            END
+        ''')
     conn.commit()
-    conn.close()
 
 with app.app_context():
     init_database()
@@ -52,172 +99,259 @@ def index():
 
 @app.route('/disk_requests')
 def get_disk_requests():
-    conn = get_db_connection()
-    db_requests = conn.execute('SELECT * FROM disk_requests ORDER BY arrival_time, request_id').fetchall()
-    conn.close()
-
-    request_list = []
-    for req in db_requests:
-        request_list.append({
-            'id': req['id'],
-            'request_id': req['request_id'],
-            'track_number': req['track_number'],
-            'arrival_time': req['arrival_time']
-        })
-    return jsonify(request_list)
+    # The data version changes on every insert, update and delete, so it makes
+    # an exact ETag: repeat polls of unchanged data skip the query and encoding
+    etag = str(get_db().execute('SELECT version FROM data_version').fetchone()[0])
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+
+    # Stream the array one row at a time straight off the cursor instead of
+    # building the whole list first. The query runs inside the generator,
+    # after the view's own teardown has already run.
+    def generate():
+        cursor = get_db().execute(
+            'SELECT id, request_id, track_number, arrival_time FROM disk_requests ORDER BY arrival_time, request_id'
+        )
+        yield '['
+        separator = ''
+        for row_id, request_id, track_number, arrival_time in cursor:
+            yield separator + app.json.dumps(
+                {'id': row_id, 'request_id': request_id, 'track_number': track_number, 'arrival_time': arrival_time}
+            )
+            separator = ','
+        yield ']'
 
-@app.route('/add_disk_request', methods=['POST'])
-def add_disk_request():
-    try:
-        data = request.get_json()
-        required_fields = ['request_id', 'track_number']
-        for field in required_fields:
-            if field not in data:
-                return jsonify({'error': f'Missing required field: {field}'}), 400
+    response = Response(stream_with_context(generate()), mimetype='application/json')
+    response.set_etag(etag)
+    # Make browsers revalidate with If-None-Match instead of reusing the list unchecked
+    response.cache_control.no_cache = True
+    return response
 
-        if data['track_number'] < 0 or data['track_number'] > 199:
-            return jsonify({'error': 'Track number must be between 0 and 199'}), 400
+def is_integer(value):
+    # JSON true/false arrive as bool, which is a subclass of int
+    return isinstance(value, int) and not isinstance(value, bool)
 
-        arrival_time = data.get('arrival_time', 0)
-        if arrival_time < 0:
-            return jsonify({'error': 'Arrival time must be non-negative'}), 400
+def check_track_number(track_number):
+    if not is_integer(track_number) or track_number < 0 or track_number > 199:
+        return 'Track number must be between 0 and 199'
+    return None
 
-        conn = get_db_connection()
-        existing = conn.execute('SELECT request_id FROM disk_requests WHERE request_id = ?', (data['request_id'],)).fetchone()
-        if existing:
-            conn.close()
-            return jsonify({'error': 'Request ID already exists'}), 400
+def check_arrival_time(arrival_time):
+    if not is_integer(arrival_time) or arrival_time < 0 or arrival_time > SQLITE_INTEGER_MAX:
+        return f'Arrival time must be an integer between 0 and {SQLITE_INTEGER_MAX}'
+    return None
+
+def validate_disk_request(data):
+    # Returns ((request_id, track_number, arrival_time), None) or (None, error message)
+    if not isinstance(data, dict):
+        return None, 'Expected a JSON object'
+
+    for field in ['request_id', 'track_number']:
+        if field not in data:
+            return None, f'Missing required field: {field}'
+
+    request_id = data['request_id']
+    if not is_integer(request_id) or abs(request_id) > SQLITE_INTEGER_MAX:
+        return None, 'Request ID must be an integer that fits in 64 bits'
+
+    arrival_time = data.get('arrival_time', 0)
+    error = check_track_number(data['track_number']) or check_arrival_time(arrival_time)
+    if error:
+        return None, error
+
+    return (request_id, data['track_number'], arrival_time), None
+
+@app.errorhandler(sqlite3.Error)
+def handle_database_error(e):
+    return jsonify({'error': str(e)}), 500
+
+@app.route('/add_disk_request', methods=['POST'])
+def add_disk_request():
+    row, error = validate_disk_request(request.get_json(silent=True))
+    if error:
+        return jsonify({'error': error}), 400
 
-        conn.execute('INSERT INTO disk_requests (request_id, track_number, arrival_time) VALUES (?, ?, ?)',
-                     (data['request_id'], data['track_number'], arrival_time))
-        conn.commit()
-        conn.close()
+    # The UNIQUE constraint on request_id does the duplicate check
+    conn = get_db()
+    try:
+        conn.execute('INSERT INTO disk_requests (request_id, track_number, arrival_time) VALUES (?, ?, ?)', row)
+    except sqlite3.IntegrityError:
+        return jsonify({'error': 'Request ID already exists'}), 400
+    conn.commit()
 
-        return jsonify({'message': 'Disk request added successfully'}), 201
+    return jsonify({'message': 'Disk request added successfully'}), 201
+
+@app.route('/add_disk_requests_bulk', methods=['POST'])
+def add_disk_requests_bulk():
+    data = request.get_json(silent=True)
+    if not isinstance(data, list) or not data:
+        return jsonify({'error': 'Expected a non-empty list of disk requests'}), 400
+
+    rows = []
+    for index, item in enumerate(data):
+        row, error = validate_disk_request(item)
+        if error:
+            return jsonify({'error': f'Request {index}: {error}'}), 400
+        rows.append(row)
+
+    request_ids = [row[0] for row in rows]
+    if len(set(request_ids)) != len(request_ids):
+        return jsonify({'error': 'Duplicate request IDs in batch'}), 400
+
+    conn = get_db()
+    # One lookup per chunk of IDs instead of a SELECT per row; chunked so large
+    # imports stay under SQLite's limit on bound parameters per statement
+    taken = []
+    for start in range(0, len(request_ids), BULK_LOOKUP_CHUNK):
+        chunk = request_ids[start:start + BULK_LOOKUP_CHUNK]
+        placeholders = ','.join('?' * len(chunk))
+        taken.extend(row[0] for row in conn.execute(
+            f'SELECT request_id FROM disk_requests WHERE request_id IN ({placeholders})', chunk))
+    if taken:
+        return jsonify({'error': f'Request IDs already exist: {sorted(taken)}'}), 400
+
+    # executemany runs inside a single transaction, so the batch costs one commit.
+    # Another writer can still take one of the IDs after the lookup above
+    try:
+        conn.executemany('INSERT INTO disk_requests (request_id, track_number, arrival_time) VALUES (?, ?, ?)', rows)
+    except sqlite3.IntegrityError:
+        return jsonify({'error': 'Request ID already exists'}), 400
+    conn.commit()
 
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return jsonify({'message': f'{len(rows)} disk requests added successfully'}), 201
 
 @app.route('/update_disk_request/<int:id>', methods=['PUT'])
 def update_disk_request(id):
-    try:
-        data = request.get_json()
-        conn = get_db_connection()
-        existing = conn.execute('SELECT * FROM disk_requests WHERE id = ?', (id,)).fetchone()
-        if not existing:
-            conn.close()
-            return jsonify({'error': 'Disk request not found'}), 404
-
-        track_number = data.get('track_number', existing['track_number'])
-        arrival_time = data.get('arrival_time', existing['arrival_time'])
-
-        if track_number < 0 or track_number > 199:
-            conn.close()
-            return jsonify({'error': 'Track number must be between 0 and 199'}), 400
-        if arrival_time < 0:
-            conn.close()
-            return jsonify({'error': 'Arrival time must be non-negative'}), 400
-
-        conn.execute('UPDATE disk_requests SET track_number = ?, arrival_time = ? WHERE id = ?',
-                     (track_number, arrival_time, id))
-        conn.commit()
-        conn.close()
-        return jsonify({'message': 'Disk request updated successfully'})
-
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Expected a JSON object'}), 400
+
+    track_number = data.get('track_number')
+    arrival_time = data.get('arrival_time')
+
+    error = ((track_number is not None and check_track_number(track_number)) or
+             (arrival_time is not None and check_arrival_time(arrival_time)))
+    if error:
+        return jsonify({'error': error}), 400
+
+    # Fields left out of the payload keep their stored value via COALESCE
+    conn = get_db()
+    cursor = conn.execute('''
+        UPDATE disk_requests
+        SET track_number = COALESCE(?, track_number), arrival_time = COALESCE(?, arrival_time)
+        WHERE id = ?
+    ''', (track_number, arrival_time, id))
+    if cursor.rowcount == 0:
+        return jsonify({'error': 'Disk request not found'}), 404
+
+    conn.commit()
+    return jsonify({'message': 'Disk request updated successfully'})
 
 @app.route('/delete_disk_request/<int:id>', methods=['DELETE'])
 def delete_disk_request(id):
-    try:
-        conn = get_db_connection()
-        disk_request = conn.execute('SELECT id FROM disk_requests WHERE id = ?', (id,)).fetchone()
-        if not disk_request:
-            conn.close()
-            return jsonify({'error': 'Disk request not found'}), 404
-
-        conn.execute('DELETE FROM disk_requests WHERE id = ?', (id,))
-        conn.commit()
-        conn.close()
-        return jsonify({'message': 'Disk request deleted successfully'})
+    conn = get_db()
+    cursor = conn.execute('DELETE FROM disk_requests WHERE id = ?', (id,))
+    if cursor.rowcount == 0:
+        return jsonify({'error': 'Disk request not found'}), 404
 
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    conn.commit()
+    return jsonify({'message': 'Disk request deleted successfully'})
 
 @app.route('/clear_disk_requests', methods=['POST'])
 def clear_disk_requests():
-    try:
-        conn = get_db_connection()
-        conn.execute('DELETE FROM disk_requests')
-        conn.commit()
-        conn.close()
-        return jsonify({'message': 'All disk requests cleared successfully'})
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    conn = get_db()
+    conn.execute('DELETE FROM disk_requests')
+    conn.commit()
+    return jsonify({'message': 'All disk requests cleared successfully'})
+
+def format_statistics(statistics, precision=2):
+    # The schedulers return raw averages; round them only for display
+    return {key: round(value, precision) if isinstance(value, float) else value
+            for key, value in statistics.items()}
+
+@lru_cache(maxsize=1)
+def load_disk_requests(version):
+    # Shared by every algorithm run against the same data version, so comparing
+    # algorithms reads the table once
+    conn = get_db()
+    return conn.execute(
+        'SELECT request_id, track_number, arrival_time FROM disk_requests ORDER BY arrival_time, request_id'
+    ).fetchall()
+
+@lru_cache(maxsize=128)
+def run_simulation(algorithm, initial_head_position, disk_size, direction, version):
+    # version is only part of the cache key: any write to disk_requests bumps it,
+    # so results computed from older data are never returned again
+    db_requests = load_disk_requests(version)
+    if not db_requests:
+        return None
+
+    # Convert database requests to DiskRequest objects (avoid overwriting Flask request).
+    # Each run gets its own objects because the schedulers record results on them.
+    disk_requests = list(starmap(DiskRequest, db_requests))
+
+    # Run the selected disk scheduling algorithm; load_disk_requests already
+    # orders rows the way FCFS services them
+    head_movement, total_seek_time, statistics = run_disk_scheduler(
+        algorithm, disk_requests, initial_head_position, disk_size, direction, presorted=True)
+    return head_movement, total_seek_time, format_statistics(statistics)
 
 @app.route('/simulate', methods=['POST'])
 def simulate_disk_scheduling():
-    try:
-        data = request.get_json()
-        algorithm = data.get('algorithm', 'fcfs')
-        initial_head_position = data.get('initial_head_position', 50)
-        disk_size = data.get('disk_size', 200)
-        direction = data.get('direction', 'up')
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Expected a JSON object'}), 400
 
-        valid_algorithms = ['fcfs', 'sstf', 'scan', 'c_scan', 'look', 'c_look']
-        if algorithm not in valid_algorithms:
-            return jsonify({'error': f'Invalid algorithm. Must be one of: {valid_algorithms}'}), 400
+    algorithm = data.get('algorithm', 'fcfs')
+    initial_head_position = data.get('initial_head_position', 50)
+    disk_size = data.get('disk_size', 200)
+    direction = data.get('direction', 'up')
 
-        if not isinstance(initial_head_position, int) or initial_head_position < 0 or initial_head_position >= disk_size:
-            return jsonify({'error': f'Initial head position must be between 0 and {disk_size-1}'}), 400
+    if not isinstance(algorithm, str) or algorithm not in DISK_ALGORITHMS:
+        return jsonify({'error': f'Invalid algorithm. Must be one of: {list(DISK_ALGORITHMS)}'}), 400
 
-        if algorithm in ['scan', 'look'] and direction not in ['up', 'down']:
-            return jsonify({'error': 'Direction must be "up" or "down" for SCAN and LOOK algorithms'}), 400
+    if not is_integer(disk_size) or disk_size <= 0:
+        return jsonify({'error': 'Disk size must be a positive integer'}), 400
 
-        conn = get_db_connection()
-        db_requests = conn.execute('SELECT * FROM disk_requests ORDER BY arrival_time, request_id').fetchall()
-        conn.close()
+    if not is_integer(initial_head_position) or initial_head_position < 0 or initial_head_position >= disk_size:
+        return jsonify({'error': f'Initial head position must be between 0 and {disk_size-1}'}), 400
 
-        if not db_requests:
-            return jsonify({'error': 'No disk requests found'}), 400
-
-        # Convert database requests to DiskRequest objects (avoid overwriting Flask request)
-        disk_requests = []
-        for db_req in db_requests:
-            disk_request = DiskRequest(
-                request_id=db_req['request_id'],
-                track_number=db_req['track_number'],
-                arrival_time=db_req['arrival_time']
-            )
-            disk_requests.append(disk_request)
-
-        # Run the selected disk scheduling algorithm
-        if algorithm == 'fcfs':
-            head_movement, total_seek_time, statistics = fcfs_disk_scheduling(disk_requests, initial_head_position)
-        elif algorithm == 'sstf':
-            head_movement, total_seek_time, statistics = sstf_disk_scheduling(disk_requests, initial_head_position)
-        elif algorithm == 'scan':
-            head_movement, total_seek_time, statistics = scan_disk_scheduling(disk_requests, initial_head_position, disk_size, direction)
-        elif algorithm == 'c_scan':
-            head_movement, total_seek_time, statistics = c_scan_disk_scheduling(disk_requests, initial_head_position, disk_size)
-        elif algorithm == 'look':
-            head_movement, total_seek_time, statistics = look_disk_scheduling(disk_requests, initial_head_position, direction)
-        elif algorithm == 'c_look':
-            head_movement, total_seek_time, statistics = c_look_disk_scheduling(disk_requests, initial_head_position)
-        else:
-            return jsonify({'error': 'Unknown algorithm'}), 400
-
-        return jsonify({
-            'algorithm': algorithm,
-            'head_movement': head_movement,
-            'total_seek_time': total_seek_time,
-            'statistics': statistics,
-            'initial_head_position': initial_head_position,
-            'message': f'{algorithm.upper()} simulation completed successfully'
-        })
-
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    if algorithm in DIRECTIONAL_ALGORITHMS:
+        if direction not in ['up', 'down']:
+            return jsonify({'error': 'Direction must be "up" or "down" for SCAN and LOOK algorithms'}), 400
+    else:
+        # Ignored by the other algorithms; normalised so it doesn't split the cache
+        direction = None
+
+    version = get_db().execute('SELECT version FROM data_version').fetchone()[0]
+    result = run_simulation(algorithm, initial_head_position, disk_size, direction, version)
+    if result is None:
+        return jsonify({'error': 'No disk requests found'}), 400
+
+    head_movement, total_seek_time, statistics = result
+
+    return jsonify({
+        'algorithm': algorithm,
+        'head_movement': head_movement,
+        'total_seek_time': total_seek_time,
+        'statistics': statistics,
+        'initial_head_position': initial_head_position,
+        'message': f'{algorithm.upper()} simulation completed successfully'
+    })
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    # The debugger and reloader are opt-in via FLASK_DEBUG=1. Otherwise serve with
+    # waitress when it is installed, or run under another WSGI server, e.g.:
+    #   gunicorn -w $(nproc) -k gthread --threads 4 app:app
+    app.debug = os.environ.get('FLASK_DEBUG') == '1'
+    try:
+        from waitress import serve
+    except ImportError:
+        serve = None
+
+    if app.debug or serve is None:
+        app.run(host='0.0.0.0', port=5000, threaded=True)
+    else:
+        serve(app, host='0.0.0.0', port=5000, threads=int(os.environ.get('WAITRESS_THREADS', 8)))
\ No newline at end of file
@@ -11,11 +11,20 @@ This module provides the core disk scheduling logic for:
 - C-LOOK (Circular LOOK)
 """
 
+from bisect import bisect_left, insort
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heappop, heappush
+from operator import sub
+
 class DiskRequest:
     """
     DiskRequest class to represent a single disk I/O request.
     Contains all necessary information for disk scheduling simulation.
     """
+    __slots__ = ('request_id', 'track_number', 'arrival_time',
+                 'service_time', 'response_time', 'completed')
+
     def __init__(self, request_id, track_number, arrival_time):
         self.request_id = request_id
         self.track_number = track_number
@@ -24,129 +33,302 @@ class DiskRequest:
         self.response_time = -1  # Time from arrival to service start
         self.completed = False
 
-def fcfs_disk_scheduling(requests, initial_head_position):
+def _arrival_order(requests):
     """
-    First Come First Serve (FCFS) Disk Scheduling Algorithm
+    Build pending-queue entries for the requests, ordered by arrival time.
+
+    Each entry is a (track_number, position, request) tuple. Keeping pending
+    entries in a list sorted by these tuples lets the schedulers find the
+    nearest request on either side of the head with a binary search; the
+    position breaks ties between requests on the same track in input order.
+
+    Returns the entries together with a parallel list of their arrival times,
+    which the schedulers walk with a cursor to admit requests as they arrive.
+    """
+    entries = [(r.track_number, position, r) for position, r in enumerate(requests)]
+    entries.sort(key=lambda entry: entry[2].arrival_time)
+    return entries, [entry[2].arrival_time for entry in entries]
+
+def _lowest_at_or_above(pending, track):
+    """Index of the pending entry with the lowest track >= track, or None."""
+    index = bisect_left(pending, (track,))
+    return index if index < len(pending) else None
+
+def _highest_at_or_below(pending, track):
+    """Index of the first pending entry on the highest track <= track, or None."""
+    index = bisect_left(pending, (track + 1,)) - 1
+    if index < 0:
+        return None
+    return bisect_left(pending, (pending[index][0],))
+
+def _is_pending(pending, entry):
+    """Whether entry is still in the sorted pending list."""
+    index = bisect_left(pending, entry)
+    return index < len(pending) and pending[index] is entry
+
+def _run_scheduler(movements):
+    """
+    Run a scheduler generator to completion.
     
-    Services disk requests in the order they arrive.
-    Simple but may cause excessive head movement.
+    Returns the (head_movement_sequence, total_seek_time, statistics) tuple
+    the public scheduler functions return.
+    """
+    head_movements = []
+    while True:
+        try:
+            head_movements.append(next(movements))
+        except StopIteration as stop:
+            # The generator's return value is carried on StopIteration
+            total_seek_time, statistics = stop.value
+            break
+    
+    if not head_movements:
+        return [], 0, {}
+    return head_movements, total_seek_time, statistics
+
+def _iter_in_order(ordered_requests, initial_head_position, first_arrival):
+    """
+    Service requests in a fixed order, waiting for any that has not arrived yet.
     
     Args:
-        requests: List of DiskRequest objects
+        ordered_requests: DiskRequest objects in the order they are serviced
         initial_head_position: Starting position of disk head
+        first_arrival: Earliest arrival time among the requests
     
-    Returns:
-        Tuple containing (head_movement_sequence, total_seek_time, statistics)
+    Yields head movements like the scheduler generators; returns
+    (total_seek_time, statistics).
     """
-    if not requests:
-        return [], 0, {}
+    # The service order is fixed, so every seek distance is known up front:
+    # |previous track - next track| for consecutive stops, starting at the head
+    tracks = [r.track_number for r in ordered_requests]
+    seek_times = list(map(abs, map(sub, [initial_head_position] + tracks[:-1], tracks)))
+    total_seek_time = sum(seek_times)
     
-    # Sort requests by arrival time
-    sorted_requests = sorted(requests, key=lambda r: (r.arrival_time, r.request_id))
-    
-    head_position = initial_head_position
     current_time = 0
-    total_seek_time = 0
-    head_movement_sequence = [{'position': head_position, 'time': current_time, 'request': None}]
+    sum_response_time = 0
+    yield {'position': initial_head_position, 'time': current_time, 'request': None}
     
-    for request in sorted_requests:
+    for request, seek_time in zip(ordered_requests, seek_times):
         # Wait for request arrival if necessary
         if current_time < request.arrival_time:
             current_time = request.arrival_time
         
-        # Calculate seek time (distance to move)
-        seek_time = abs(head_position - request.track_number)
-        total_seek_time += seek_time
-        
         # Move head to request position
         head_position = request.track_number
         current_time += seek_time if seek_time > 0 else 1  # Minimum 1 unit for processing
         
         # Record request completion
         request.service_time = current_time
-        request.response_time = current_time - request.arrival_time
+        response_time = current_time - request.arrival_time
+        request.response_time = response_time
+        sum_response_time += response_time
         request.completed = True
         
         # Record head movement
-        head_movement_sequence.append({
-            'position': head_position,
-            'time': current_time,
-            'request': request.request_id,
-            'seek_distance': seek_time
-        })
+        yield {'position': head_position, 'time': current_time, 'request': request.request_id,
+               'seek_distance': seek_time}
+    
+    statistics = calculate_disk_statistics(len(ordered_requests), total_seek_time, sum_response_time, current_time,
+                                           first_arrival)
+    return total_seek_time, statistics
+
+def _sweep_order(entries, head_position, going_up):
+    """
+    Service order of a SCAN/LOOK sweep when every request is already pending.
+    
+    entries are the (track_number, position, request) tuples in sorted order.
+    The head services one side of its position, then reverses once; requests
+    on the same track go in input order either way.
+    """
+    split = bisect_left(entries, (head_position,) if going_up else (head_position + 1,))
+    above = entries[split:]
+    below = sorted(entries[:split], key=lambda entry: (-entry[0], entry[1]))
+    ordered = above + below if going_up else below + above
+    return [entry[2] for entry in ordered]
+
+def _sstf_order(entries, head_position):
+    """
+    Service order of SSTF when every request is already pending.
     
-    statistics = calculate_disk_statistics(sorted_requests, total_seek_time, current_time)
-    return head_movement_sequence, total_seek_time, statistics
+    Serviced tracks always form a contiguous run of the sorted tracks, so the
+    next track is one of the two tracks just outside that run. Equal distances
+    go to the track whose first request came first in the input.
+    """
+    tracks = []  # (track_number, first position, requests in input order)
+    for track, position, r in entries:
+        if tracks and tracks[-1][0] == track:
+            tracks[-1][2].append(r)
+        else:
+            tracks.append((track, position, [r]))
+    
+    above = bisect_left(tracks, (head_position,))
+    below = above - 1
+    ordered = []
+    while below >= 0 or above < len(tracks):
+        if below < 0:
+            take_below = False
+        elif above == len(tracks):
+            take_below = True
+        else:
+            distance_below = head_position - tracks[below][0]
+            distance_above = tracks[above][0] - head_position
+            take_below = distance_below < distance_above or (
+                distance_below == distance_above and tracks[below][1] < tracks[above][1])
+        if take_below:
+            head_position, _, track_requests = tracks[below]
+            below -= 1
+        else:
+            head_position, _, track_requests = tracks[above]
+            above += 1
+        ordered.extend(track_requests)
+    return ordered
 
-def sstf_disk_scheduling(requests, initial_head_position):
+def fcfs_disk_scheduling(requests, initial_head_position, presorted=False):
+    """
+    First Come First Serve (FCFS) Disk Scheduling Algorithm
+    
+    Services disk requests in the order they arrive.
+    Simple but may cause excessive head movement.
+    
+    Args:
+        requests: List of DiskRequest objects (their service_time,
+                  response_time and completed fields are filled in)
+        initial_head_position: Starting position of disk head
+        presorted: True if requests are already ordered by
+                   (arrival_time, request_id), which skips the sort
+    
+    Returns:
+        Tuple containing (head_movement_sequence, total_seek_time, statistics)
+    """
+    return _run_scheduler(iter_fcfs_disk_scheduling(requests, initial_head_position, presorted))
+
+def iter_fcfs_disk_scheduling(requests, initial_head_position, presorted=False):
+    """
+    Generator form of fcfs_disk_scheduling.
+    
+    Yields each head movement dict of the sequence fcfs_disk_scheduling
+    returns as soon as it happens, and returns (total_seek_time, statistics)
+    when the schedule is complete. Useful when only the totals are needed or
+    the movements are streamed, since the sequence is never held in memory.
+    """
+    if not requests:
+        return 0, {}
+    
+    # Sort requests by arrival time
+    if presorted:
+        sorted_requests = requests
+    else:
+        sorted_requests = sorted(requests, key=lambda r: (r.arrival_time, r.request_id))
+    
+    return (yield from _iter_in_order(sorted_requests, initial_head_position, sorted_requests[0].arrival_time))
+
+def sstf_disk_scheduling(requests, initial_head_position, starvation_threshold=None):
     """
     Shortest Seek Time First (SSTF) Disk Scheduling Algorithm
     
     Always services the request closest to the current head position.
-    Minimizes seek time but can cause starvation.
+    Minimizes seek time but can cause starvation. With a starvation threshold,
+    a request that has waited longer than the threshold is serviced next
+    regardless of seek distance (oldest first), bounding response times.
     
     Args:
-        requests: List of DiskRequest objects
+        requests: List of DiskRequest objects (their service_time,
+                  response_time and completed fields are filled in)
         initial_head_position: Starting position of disk head
+        starvation_threshold: Maximum wait before a request is forced ahead
+                              (default: None, plain SSTF)
     
     Returns:
         Tuple containing (head_movement_sequence, total_seek_time, statistics)
     """
+    return _run_scheduler(iter_sstf_disk_scheduling(requests, initial_head_position, starvation_threshold))
+
+def iter_sstf_disk_scheduling(requests, initial_head_position, starvation_threshold=None):
+    """Generator form of sstf_disk_scheduling; see iter_fcfs_disk_scheduling."""
     if not requests:
-        return [], 0, {}
-    
-    requests_copy = [DiskRequest(r.request_id, r.track_number, r.arrival_time) for r in requests]
-    pending_requests = []
-    completed_requests = []
+        return 0, {}
+    
+    arrivals, arrival_times = _arrival_order(requests)
+    if arrival_times[-1] <= 0 and starvation_threshold is None:
+        # Static batch: everything is pending from the start, so the service
+        # order is fixed and can be worked out in one pass
+        return (yield from _iter_in_order(_sstf_order(sorted(arrivals), initial_head_position),
+                                          initial_head_position, arrival_times[0]))
+    num_requests = len(requests)
+    next_arrival = 0  # Index of the first request in arrivals that has not arrived yet
+    pending_requests = []  # Sorted by track number
+    deadline_queue = deque()  # Pending entries in arrival order, oldest first
+    num_completed = 0
     
     head_position = initial_head_position
     current_time = 0
     total_seek_time = 0
-    head_movement_sequence = [{'position': head_position, 'time': current_time, 'request': None}]
+    sum_response_time = 0
+    yield {'position': head_position, 'time': current_time, 'request': None}
     
-    while len(completed_requests) < len(requests_copy):
+    while num_completed < num_requests:
         # Add newly arrived requests to pending queue
-        for request in requests_copy:
-            if (request.arrival_time <= current_time and 
-                request not in pending_requests and 
-                request not in completed_requests):
-                pending_requests.append(request)
-        
-        if pending_requests:
-            # Select request with shortest seek time from current position
-            closest_request = min(pending_requests, 
-                                key=lambda r: abs(r.track_number - head_position))
-            pending_requests.remove(closest_request)
-            
-            # Calculate seek time
-            seek_time = abs(head_position - closest_request.track_number)
-            total_seek_time += seek_time
-            
-            # Move head to request position
-            head_position = closest_request.track_number
-            current_time += seek_time if seek_time > 0 else 1
-            
-            # Complete the request
-            closest_request.service_time = current_time
-            closest_request.response_time = current_time - closest_request.arrival_time
-            closest_request.completed = True
-            completed_requests.append(closest_request)
-            
-            # Record head movement
-            head_movement_sequence.append({
-                'position': head_position,
-                'time': current_time,
-                'request': closest_request.request_id,
-                'seek_distance': seek_time
-            })
-        else:
+        while next_arrival < num_requests and arrival_times[next_arrival] <= current_time:
+            insort(pending_requests, arrivals[next_arrival])
+            if starvation_threshold is not None:
+                deadline_queue.append(arrivals[next_arrival])
+            next_arrival += 1
+        
+        if not pending_requests:
             # No pending requests, advance time to next arrival
-            next_arrivals = [r.arrival_time for r in requests_copy if r not in completed_requests]
-            if next_arrivals:
-                current_time = min(next_arrivals)
+            current_time = arrival_times[next_arrival]
+            continue
+        
+        # Drop serviced requests from the front of the deadline queue
+        while deadline_queue and not _is_pending(pending_requests, deadline_queue[0]):
+            deadline_queue.popleft()
+        
+        if deadline_queue and current_time - deadline_queue[0][2].arrival_time > starvation_threshold:
+            # The oldest request has waited too long, service it next
+            index = bisect_left(pending_requests, deadline_queue.popleft())
+        else:
+            # Select request with shortest seek time from current position:
+            # it is the nearest pending request either above or below the head.
+            # One binary search finds both neighbours; the second search for the
+            # first request on the lower track only runs when that side can win.
+            index = bisect_left(pending_requests, (head_position,))
+            if index > 0:
+                below_track = pending_requests[index - 1][0]
+                if index == len(pending_requests):
+                    index = bisect_left(pending_requests, (below_track,))
+                else:
+                    distance_above = pending_requests[index][0] - head_position
+                    distance_below = head_position - below_track
+                    if distance_below <= distance_above:
+                        below = bisect_left(pending_requests, (below_track,))
+                        # Equal distances go to the request that came first in the input
+                        if distance_below < distance_above or pending_requests[below][1] < pending_requests[index][1]:
+                            index = below
+        closest_request = pending_requests.pop(index)[2]
+        
+        # Calculate seek time
+        seek_time = abs(head_position - closest_request.track_number)
+        total_seek_time += seek_time
+        
+        # Move head to request position
+        head_position = closest_request.track_number
+        current_time += seek_time if seek_time > 0 else 1
+        
+        # Complete the request
+        closest_request.service_time = current_time
+        response_time = current_time - closest_request.arrival_time
+        closest_request.response_time = response_time
+        sum_response_time += response_time
+        closest_request.completed = True
+        num_completed += 1
+        
+        # Record head movement
+        yield {'position': head_position, 'time': current_time, 'request': closest_request.request_id,
+               'seek_distance': seek_time}
     
-    statistics = calculate_disk_statistics(completed_requests, total_seek_time, current_time)
-    return head_movement_sequence, total_seek_time, statistics
+    statistics = calculate_disk_statistics(num_completed, total_seek_time, sum_response_time, current_time,
+                                           arrival_times[0])
+    return total_seek_time, statistics
 
 def scan_disk_scheduling(requests, initial_head_position, disk_size=200, direction='up'):
     """
@@ -156,7 +338,8 @@ def scan_disk_scheduling(requests, initial_head_position, disk_size=200, directi
     Good for reducing variance in response time.
     
     Args:
-        requests: List of DiskRequest objects
+        requests: List of DiskRequest objects (their service_time,
+                  response_time and completed fields are filled in)
         initial_head_position: Starting position of disk head
         disk_size: Total number of tracks (default: 200)
         direction: Initial direction ('up' or 'down')
@@ -164,81 +347,99 @@ def scan_disk_scheduling(requests, initial_head_position, disk_size=200, directi
     Returns:
         Tuple containing (head_movement_sequence, total_seek_time, statistics)
     """
+    return _run_scheduler(iter_scan_disk_scheduling(requests, initial_head_position, disk_size, direction))
+
+def iter_scan_disk_scheduling(requests, initial_head_position, disk_size=200, direction='up'):
+    """Generator form of scan_disk_scheduling; see iter_fcfs_disk_scheduling."""
     if not requests:
-        return [], 0, {}
-    
-    requests_copy = [DiskRequest(r.request_id, r.track_number, r.arrival_time) for r in requests]
-    for r in requests_copy:
-        r.completed = False
-    completed_requests = []
+        return 0, {}
+    
+    arrivals, arrival_times = _arrival_order(requests)
+    if arrival_times[-1] <= 0:
+        # Static batch: everything is pending from the start, so the service
+        # order is fixed and can be worked out in one pass
+        return (yield from _iter_in_order(_sweep_order(sorted(arrivals), initial_head_position, direction == 'up'),
+                                          initial_head_position, arrival_times[0]))
+    num_requests = len(requests)
+    next_arrival = 0  # Index of the first request in arrivals that has not arrived yet
+    # Arrived, not yet serviced requests, split at the head: upper_heap holds
+    # (track, position, request) entries with track >= head position, lower_heap
+    # holds (-track, position, request) entries with track < head position
+    upper_heap = []
+    lower_heap = []
+    num_completed = 0
     
     head_position = initial_head_position
     current_time = 0
     total_seek_time = 0
-    head_movement_sequence = [{'position': head_position, 'time': current_time, 'request': None}]
+    sum_response_time = 0
+    yield {'position': head_position, 'time': current_time, 'request': None}
     going_up = direction == 'up'
     
-    while len(completed_requests) < len(requests_copy):
-        # Get requests that have arrived at current time
-        available_requests = [r for r in requests_copy if r.arrival_time <= current_time and not r.completed]
+    while num_completed < num_requests:
+        # Add requests that have arrived by the current time
+        while next_arrival < num_requests and arrival_times[next_arrival] <= current_time:
+            entry = arrivals[next_arrival]
+            if entry[0] >= head_position:
+                heappush(upper_heap, entry)
+            else:
+                heappush(lower_heap, (-entry[0], entry[1], entry[2]))
+            next_arrival += 1
         
-        if not available_requests:
+        if not upper_heap and not lower_heap:
             # No requests available, advance time to next arrival
-            next_arrivals = [r.arrival_time for r in requests_copy if not r.completed]
-            if next_arrivals:
-                current_time = min(next_arrivals)
-                continue
-            else:
-                break
+            current_time = arrival_times[next_arrival]
+            continue
         if going_up:
-            # Find requests in current direction (up)
-            candidates = [r for r in available_requests if r.track_number >= head_position]
-            if candidates:
-                # Service closest request in up direction
-                next_request = min(candidates, key=lambda r: r.track_number)
+            # Service closest request in up direction
+            if upper_heap:
+                next_request = heappop(upper_heap)[2]
             else:
                 # No more requests in up direction, reverse and go to highest remaining
                 going_up = False
-                candidates = [r for r in available_requests if r.track_number < head_position]
-                next_request = max(candidates, key=lambda r: r.track_number) if candidates else None
+                next_request = heappop(lower_heap)[2]
+                # Requests on the new head track now belong above the head
+                while lower_heap and lower_heap[0][0] == -next_request.track_number:
+                    entry = heappop(lower_heap)
+                    heappush(upper_heap, (-entry[0], entry[1], entry[2]))
         else:
-            # Find requests in current direction (down)
-            candidates = [r for r in available_requests if r.track_number <= head_position]
-            if candidates:
-                # Service closest request in down direction
-                next_request = max(candidates, key=lambda r: r.track_number)
+            # Service closest request in down direction
+            if upper_heap and upper_heap[0][0] == head_position:
+                next_request = heappop(upper_heap)[2]
+            elif lower_heap:
+                next_request = heappop(lower_heap)[2]
+                # Requests on the new head track now belong above the head
+                while lower_heap and lower_heap[0][0] == -next_request.track_number:
+                    entry = heappop(lower_heap)
+                    heappush(upper_heap, (-entry[0], entry[1], entry[2]))
             else:
                 # No more requests in down direction, reverse and go to lowest remaining
                 going_up = True
-                candidates = [r for r in available_requests if r.track_number > head_position]
-                next_request = min(candidates, key=lambda r: r.track_number) if candidates else None
+                next_request = heappop(upper_heap)[2]
         
-        if next_request:
-            # Calculate seek time
-            seek_time = abs(head_position - next_request.track_number)
-            total_seek_time += seek_time
-            
-            # Move head to request position
-            head_position = next_request.track_number
-            current_time += seek_time if seek_time > 0 else 1
-            
-            # Complete the request
-            next_request.service_time = current_time
-            next_request.response_time = current_time - next_request.arrival_time
-            next_request.completed = True
-            available_requests.remove(next_request)
-            completed_requests.append(next_request)
-            
-            # Record head movement
-            head_movement_sequence.append({
-                'position': head_position,
-                'time': current_time,
-                'request': next_request.request_id,
-                'seek_distance': seek_time
-            })
+        # Calculate seek time
+        seek_time = abs(head_position - next_request.track_number)
+        total_seek_time += seek_time
+        
+        # Move head to request position
+        head_position = next_request.track_number
+        current_time += seek_time if seek_time > 0 else 1
+        
+        # Complete the request
+        next_request.service_time = current_time
+        response_time = current_time - next_request.arrival_time
+        next_request.response_time = response_time
+        sum_response_time += response_time
+        next_request.completed = True
+        num_completed += 1
+        
+        # Record head movement
+        yield {'position': head_position, 'time': current_time, 'request': next_request.request_id,
+               'seek_distance': seek_time}
     
-    statistics = calculate_disk_statistics(completed_requests, total_seek_time, current_time)
-    return head_movement_sequence, total_seek_time, statistics
+    statistics = calculate_disk_statistics(num_completed, total_seek_time, sum_response_time, current_time,
+                                           arrival_times[0])
+    return total_seek_time, statistics
 
 def c_scan_disk_scheduling(requests, initial_head_position, disk_size=200):
     """
@@ -248,61 +449,63 @@ def c_scan_disk_scheduling(requests, initial_head_position, disk_size=200):
     Provides more uniform wait times than SCAN.
     
     Args:
-        requests: List of DiskRequest objects
+        requests: List of DiskRequest objects (their service_time,
+                  response_time and completed fields are filled in)
         initial_head_position: Starting position of disk head
         disk_size: Total number of tracks (default: 200)
     
     Returns:
         Tuple containing (head_movement_sequence, total_seek_time, statistics)
     """
+    return _run_scheduler(iter_c_scan_disk_scheduling(requests, initial_head_position, disk_size))
+
+def iter_c_scan_disk_scheduling(requests, initial_head_position, disk_size=200):
+    """Generator form of c_scan_disk_scheduling; see iter_fcfs_disk_scheduling."""
     if not requests:
-        return [], 0, {}
+        return 0, {}
     
-    requests_copy = [DiskRequest(r.request_id, r.track_number, r.arrival_time) for r in requests]
-    for r in requests_copy:
-        r.completed = False
-    completed_requests = []
+    arrivals, arrival_times = _arrival_order(requests)
+    num_requests = len(requests)
+    next_arrival = 0  # Index of the first request in arrivals that has not arrived yet
+    # Arrived, not yet serviced (track, position, request) entries, split at the
+    # head: upper_heap holds tracks >= head position, lower_heap tracks below it
+    upper_heap = []
+    lower_heap = []
+    num_completed = 0
     
     head_position = initial_head_position
     current_time = 0
     total_seek_time = 0
-    head_movement_sequence = [{'position': head_position, 'time': current_time, 'request': None}]
-    
-    while len(completed_requests) < len(requests_copy):
-        # Get requests that have arrived at current time
-        available_requests = [r for r in requests_copy if r.arrival_time <= current_time and not r.completed]
+    sum_response_time = 0
+    yield {'position': head_position, 'time': current_time, 'request': None}
+    
+    while num_completed < num_requests:
+        # Add requests that have arrived by the current time
+        while next_arrival < num_requests and arrival_times[next_arrival] <= current_time:
+            entry = arrivals[next_arrival]
+            heappush(upper_heap if entry[0] >= head_position else lower_heap, entry)
+            next_arrival += 1
         
-        if not available_requests:
+        if not upper_heap and not lower_heap:
             # No requests available, advance time to next arrival
-            next_arrivals = [r.arrival_time for r in requests_copy if not r.completed]
-            if next_arrivals:
-                current_time = min(next_arrivals)
-                continue
-            else:
-                break
-        # Find requests at or above current position
-        candidates = [r for r in available_requests if r.track_number >= head_position]
+            current_time = arrival_times[next_arrival]
+            continue
         
-        if candidates:
-            # Service next request in ascending order
-            next_request = min(candidates, key=lambda r: r.track_number)
-        else:
+        if not upper_heap:
             # No requests ahead, jump to beginning (lowest track)
-            next_request = min(available_requests, key=lambda r: r.track_number)
             # Add seek time for jumping to beginning
             jump_seek_time = head_position  # Seek to track 0, then to lowest request
             total_seek_time += jump_seek_time
             current_time += jump_seek_time
             head_position = 0
+            upper_heap, lower_heap = lower_heap, []
             
             # Record the jump
-            head_movement_sequence.append({
-                'position': 0,
-                'time': current_time,
-                'request': None,
-                'seek_distance': jump_seek_time,
-                'action': 'jump_to_start'
-            })
+            yield {'position': 0, 'time': current_time, 'request': None,
+                   'seek_distance': jump_seek_time, 'action': 'jump_to_start'}
+        
+        # Service next request in ascending order
+        next_request = heappop(upper_heap)[2]
         
         # Calculate seek time to next request
         seek_time = abs(head_position - next_request.track_number)
@@ -314,21 +517,19 @@ def c_scan_disk_scheduling(requests, initial_head_position, disk_size=200):
         
         # Complete the request
         next_request.service_time = current_time
-        next_request.response_time = current_time - next_request.arrival_time
+        response_time = current_time - next_request.arrival_time
+        next_request.response_time = response_time
+        sum_response_time += response_time
         next_request.completed = True
-        available_requests.remove(next_request)
-        completed_requests.append(next_request)
+        num_completed += 1
         
         # Record head movement
-        head_movement_sequence.append({
-            'position': head_position,
-            'time': current_time,
-            'request': getattr(next_request, 'request_id', None),
-            'seek_distance': seek_time
-        })
+        yield {'position': head_position, 'time': current_time, 'request': next_request.request_id,
+               'seek_distance': seek_time}
     
-    statistics = calculate_disk_statistics(completed_requests, total_seek_time, current_time)
-    return head_movement_sequence, total_seek_time, statistics
+    statistics = calculate_disk_statistics(num_completed, total_seek_time, sum_response_time, current_time,
+                                           arrival_times[0])
+    return total_seek_time, statistics
 
 def look_disk_scheduling(requests, initial_head_position, direction='up'):
     """
@@ -338,90 +539,88 @@ def look_disk_scheduling(requests, initial_head_position, direction='up'):
     then reverses direction. No need to go to disk ends.
     
     Args:
-        requests: List of DiskRequest objects
+        requests: List of DiskRequest objects (their service_time,
+                  response_time and completed fields are filled in)
         initial_head_position: Starting position of disk head
         direction: Initial direction ('up' or 'down')
     
     Returns:
         Tuple containing (head_movement_sequence, total_seek_time, statistics)
     """
+    return _run_scheduler(iter_look_disk_scheduling(requests, initial_head_position, direction))
+
+def iter_look_disk_scheduling(requests, initial_head_position, direction='up'):
+    """Generator form of look_disk_scheduling; see iter_fcfs_disk_scheduling."""
     if not requests:
-        return [], 0, {}
-    
-    requests_copy = [DiskRequest(r.request_id, r.track_number, r.arrival_time) for r in requests]
-    completed_requests = []
+        return 0, {}
+    
+    arrivals, arrival_times = _arrival_order(requests)
+    if arrival_times[-1] <= 0:
+        # Static batch: everything is pending from the start, so the service
+        # order is fixed and can be worked out in one pass
+        return (yield from _iter_in_order(_sweep_order(sorted(arrivals), initial_head_position, direction == 'up'),
+                                          initial_head_position, arrival_times[0]))
+    num_requests = len(requests)
+    next_arrival = 0  # Index of the first request in arrivals that has not arrived yet
+    available_requests = []  # Arrived, not yet serviced, sorted by track number
+    num_completed = 0
     
     head_position = initial_head_position
     current_time = 0
     total_seek_time = 0
-    head_movement_sequence = [{'position': head_position, 'time': current_time, 'request': None}]
+    sum_response_time = 0
+    yield {'position': head_position, 'time': current_time, 'request': None}
     going_up = direction == 'up'
     
-    # Initialize completed flag for all requests
-    for r in requests_copy:
-        r.completed = False
-    
-    while len(completed_requests) < len(requests_copy):
-        # Get requests that have arrived at current time
-        available_requests = [r for r in requests_copy if r.arrival_time <= current_time and not r.completed]
+    while num_completed < num_requests:
+        # Add requests that have arrived by the current time
+        while next_arrival < num_requests and arrival_times[next_arrival] <= current_time:
+            insort(available_requests, arrivals[next_arrival])
+            next_arrival += 1
         
         if not available_requests:
             # No requests available, advance time to next arrival
-            next_arrivals = [r.arrival_time for r in requests_copy if not r.completed]
-            if next_arrivals:
-                current_time = min(next_arrivals)
-                continue
-            else:
-                break
+            current_time = arrival_times[next_arrival]
+            continue
         if going_up:
-            # Find requests at or above current position
-            candidates = [r for r in available_requests if r.track_number >= head_position]
-            if candidates:
-                # Service next closest request in up direction
-                next_request = min(candidates, key=lambda r: r.track_number)
-            else:
+            # Service next closest request at or above current position
+            index = _lowest_at_or_above(available_requests, head_position)
+            if index is None:
                 # No more requests above, reverse direction to highest remaining below
                 going_up = False
-                candidates = [r for r in available_requests if r.track_number < head_position]
-                next_request = max(candidates, key=lambda r: r.track_number) if candidates else None
+                index = _highest_at_or_below(available_requests, head_position - 1)
         else:
-            # Find requests at or below current position
-            candidates = [r for r in available_requests if r.track_number <= head_position]
-            if candidates:
-                # Service next closest request in down direction
-                next_request = max(candidates, key=lambda r: r.track_number)
-            else:
+            # Service next closest request at or below current position
+            index = _highest_at_or_below(available_requests, head_position)
+            if index is None:
                 # No more requests below, reverse direction to lowest remaining above
                 going_up = True
-                candidates = [r for r in available_requests if r.track_number > head_position]
-                next_request = min(candidates, key=lambda r: r.track_number) if candidates else None
+                index = _lowest_at_or_above(available_requests, head_position + 1)
+        next_request = available_requests.pop(index)[2]
         
-        if next_request:
-            # Calculate seek time
-            seek_time = abs(head_position - next_request.track_number)
-            total_seek_time += seek_time
-            
-            # Move head to request position
-            head_position = next_request.track_number
-            current_time += seek_time if seek_time > 0 else 1
-            
-            # Complete the request
-            next_request.service_time = current_time
-            next_request.response_time = current_time - next_request.arrival_time
-            next_request.completed = True
-            available_requests.remove(next_request)
-            completed_requests.append(next_request)
-            
-            # Record head movement
-            head_movement_sequence.append({
-                'position': head_position,
-                'time': current_time,
-                'request': next_request.request_id,
-                'seek_distance': seek_time
-            })
+        # Calculate seek time
+        seek_time = abs(head_position - next_request.track_number)
+        total_seek_time += seek_time
+        
+        # Move head to request position
+        head_position = next_request.track_number
+        current_time += seek_time if seek_time > 0 else 1
+        
+        # Complete the request
+        next_request.service_time = current_time
+        response_time = current_time - next_request.arrival_time
+        next_request.response_time = response_time
+        sum_response_time += response_time
+        next_request.completed = True
+        num_completed += 1
+        
+        # Record head movement
+        yield {'position': head_position, 'time': current_time, 'request': next_request.request_id,
+               'seek_distance': seek_time}
     
-    statistics = calculate_disk_statistics(completed_requests, total_seek_time, current_time)
-    return head_movement_sequence, total_seek_time, statistics
+    statistics = calculate_disk_statistics(num_completed, total_seek_time, sum_response_time, current_time,
+                                           arrival_times[0])
+    return total_seek_time, statistics
 
 def c_look_disk_scheduling(requests, initial_head_position):
     """
@@ -431,50 +630,55 @@ def c_look_disk_scheduling(requests, initial_head_position):
     then jumps to the lowest request and continues upward.
     
     Args:
-        requests: List of DiskRequest objects
+        requests: List of DiskRequest objects (their service_time,
+                  response_time and completed fields are filled in)
         initial_head_position: Starting position of disk head
     
     Returns:
         Tuple containing (head_movement_sequence, total_seek_time, statistics)
     """
+    return _run_scheduler(iter_c_look_disk_scheduling(requests, initial_head_position))
+
+def iter_c_look_disk_scheduling(requests, initial_head_position):
+    """Generator form of c_look_disk_scheduling; see iter_fcfs_disk_scheduling."""
     if not requests:
-        return [], 0, {}
-    
-    requests_copy = [DiskRequest(r.request_id, r.track_number, r.arrival_time) for r in requests]
-    completed_requests = []
+        return 0, {}
+    
+    arrivals, arrival_times = _arrival_order(requests)
+    if arrival_times[-1] <= 0:
+        # Static batch: one ascending pass from the head, then wrap to the lowest track
+        entries = sorted(arrivals)
+        split = bisect_left(entries, (initial_head_position,))
+        return (yield from _iter_in_order([entry[2] for entry in entries[split:] + entries[:split]],
+                                          initial_head_position, arrival_times[0]))
+    num_requests = len(requests)
+    next_arrival = 0  # Index of the first request in arrivals that has not arrived yet
+    available_requests = []  # Arrived, not yet serviced, sorted by track number
+    num_completed = 0
     
     head_position = initial_head_position
     current_time = 0
     total_seek_time = 0
-    head_movement_sequence = [{'position': head_position, 'time': current_time, 'request': None}]
-    
-    # Initialize completed flag for all requests
-    for r in requests_copy:
-        r.completed = False
-    
-    while len(completed_requests) < len(requests_copy):
-        # Get requests that have arrived at current time
-        available_requests = [r for r in requests_copy if r.arrival_time <= current_time and not r.completed]
+    sum_response_time = 0
+    yield {'position': head_position, 'time': current_time, 'request': None}
+    
+    while num_completed < num_requests:
+        # Add requests that have arrived by the current time
+        while next_arrival < num_requests and arrival_times[next_arrival] <= current_time:
+            insort(available_requests, arrivals[next_arrival])
+            next_arrival += 1
         
         if not available_requests:
             # No requests available, advance time to next arrival
-            next_arrivals = [r.arrival_time for r in requests_copy if not r.completed]
-            if next_arrivals:
-                current_time = min(next_arrivals)
-                continue
-            else:
-                break
+            current_time = arrival_times[next_arrival]
+            continue
 
-        # Find requests at or above current position
-        candidates = [r for r in available_requests if r.track_number >= head_position]
-        
-        next_request = None
-        if candidates:
-            # Service next request in ascending order
-            next_request = min(candidates, key=lambda r: r.track_number)
-        else:
+        # Service next request in ascending order
+        index = _lowest_at_or_above(available_requests, head_position)
+        if index is None:
             # No requests ahead, jump to lowest remaining request
-            next_request = min(available_requests, key=lambda r: r.track_number)
+            index = 0
+        next_request = available_requests.pop(index)[2]
         
         # Calculate seek time to the determined next request
         seek_time = abs(head_position - next_request.track_number)
@@ -486,34 +690,38 @@ def c_look_disk_scheduling(requests, initial_head_position):
         
         # Complete the request
         next_request.service_time = current_time
-        next_request.response_time = current_time - next_request.arrival_time
+        response_time = current_time - next_request.arrival_time
+        next_request.response_time = response_time
+        sum_response_time += response_time
         next_request.completed = True
-        completed_requests.append(next_request)
+        num_completed += 1
         
         # Record the single, correct head movement
-        head_movement_sequence.append({
-            'position': head_position,
-            'time': current_time,
-            'request': next_request.request_id,
-            'seek_distance': seek_time
-        })
+        yield {'position': head_position, 'time': current_time, 'request': next_request.request_id,
+               'seek_distance': seek_time}
     
-    statistics = calculate_disk_statistics(completed_requests, total_seek_time, current_time)
-    return head_movement_sequence, total_seek_time, statistics
+    statistics = calculate_disk_statistics(num_completed, total_seek_time, sum_response_time, current_time,
+                                           arrival_times[0])
+    return total_seek_time, statistics
 
-def calculate_disk_statistics(completed_requests, total_seek_time, total_time):
+def calculate_disk_statistics(num_completed, total_seek_time, sum_response_time, total_time, first_arrival=0):
     """
-    Calculate disk scheduling statistics for the completed requests.
+    Calculate disk scheduling statistics from totals gathered during scheduling.
+    
+    Values are returned unrounded; formatting them for display is up to the caller.
     
     Args:
-        completed_requests: List of completed DiskRequest objects
+        num_completed: Number of completed requests
         total_seek_time: Total seek time across all requests
+        sum_response_time: Sum of the response times of the completed requests
         total_time: Total time to complete all requests
+        first_arrival: Arrival time of the earliest request; throughput is
+                       measured from here rather than from time 0
     
     Returns:
         Dictionary containing disk performance statistics
     """
-    if not completed_requests:
+    if not num_completed:
         return {
             'total_requests': 0,
             'total_seek_time': 0,
@@ -523,13 +731,101 @@ def calculate_disk_statistics(completed_requests, total_seek_time, total_time):
             'throughput': 0
         }
     
-    total_response_time = sum(r.response_time for r in completed_requests)
-    
+    busy_time = total_time - first_arrival
     return {
-        'total_requests': len(completed_requests),
+        'total_requests': num_completed,
         'total_seek_time': total_seek_time,
-        'avg_seek_time': round(total_seek_time / len(completed_requests), 2),
-        'avg_response_time': round(total_response_time / len(completed_requests), 2),
+        'avg_seek_time': total_seek_time / num_completed,
+        'avg_response_time': sum_response_time / num_completed,
         'total_completion_time': total_time,
-        'throughput': round(len(completed_requests) / total_time, 2) if total_time > 0 else 0
-    }
\ No newline at end of file
+        'throughput': num_completed / busy_time if busy_time > 0 else 0
+    }
+
+# Each algorithm adapted to the same (requests, initial_head_position, disk_size,
+# direction, presorted) signature. These are plain functions rather than lambdas
+# so the table can also be used from worker processes.
+def _run_fcfs(requests, initial_head_position, disk_size, direction, presorted):
+    return fcfs_disk_scheduling(requests, initial_head_position, presorted)
+
+def _run_sstf(requests, initial_head_position, disk_size, direction, presorted):
+    return sstf_disk_scheduling(requests, initial_head_position)
+
+def _run_scan(requests, initial_head_position, disk_size, direction, presorted):
+    return scan_disk_scheduling(requests, initial_head_position, disk_size, direction)
+
+def _run_c_scan(requests, initial_head_position, disk_size, direction, presorted):
+    return c_scan_disk_scheduling(requests, initial_head_position, disk_size)
+
+def _run_look(requests, initial_head_position, disk_size, direction, presorted):
+    return look_disk_scheduling(requests, initial_head_position, direction)
+
+def _run_c_look(requests, initial_head_position, disk_size, direction, presorted):
+    return c_look_disk_scheduling(requests, initial_head_position)
+
+DISK_ALGORITHMS = {
+    'fcfs': _run_fcfs,
+    'sstf': _run_sstf,
+    'scan': _run_scan,
+    'c_scan': _run_c_scan,
+    'look': _run_look,
+    'c_look': _run_c_look,
+}
+
+def run_disk_scheduler(algorithm, requests, initial_head_position, disk_size=200, direction='up',
+                       presorted=False):
+    """
+    Run one disk scheduling algorithm by name.
+    
+    Args:
+        algorithm: Name of the algorithm, one of the keys of DISK_ALGORITHMS
+        requests: List of DiskRequest objects
+        initial_head_position: Starting position of disk head
+        disk_size: Total number of tracks, used by SCAN and C-SCAN (default: 200)
+        direction: Initial direction for SCAN and LOOK ('up' or 'down')
+        presorted: True if requests are already ordered by (arrival_time, request_id),
+                   which lets FCFS skip its sort
+    
+    Returns:
+        Tuple containing (head_movement_sequence, total_seek_time, statistics)
+    
+    Raises:
+        ValueError: If algorithm is not a known algorithm name
+    """
+    try:
+        scheduler = DISK_ALGORITHMS[algorithm]
+    except KeyError:
+        raise ValueError(f'Unknown disk scheduling algorithm: {algorithm!r}') from None
+    return scheduler(requests, initial_head_position, disk_size, direction, presorted)
+
+def _run_disk_scheduler(algorithm, request_fields, initial_head_position, disk_size, direction):
+    """Worker for run_all_disk_schedulers: rebuild the requests and run one algorithm."""
+    requests = [DiskRequest(*fields) for fields in request_fields]
+    return run_disk_scheduler(algorithm, requests, initial_head_position, disk_size, direction)
+
+def run_all_disk_schedulers(requests, initial_head_position, disk_size=200, direction='up', max_workers=None):
+    """
+    Run every disk scheduling algorithm on the same requests in parallel.
+    
+    Each algorithm runs in its own worker process on a private copy of the
+    requests, so the caller's DiskRequest objects are left untouched.
+    
+    Args:
+        requests: List of DiskRequest objects
+        initial_head_position: Starting position of disk head
+        disk_size: Total number of tracks (default: 200)
+        direction: Initial direction for SCAN and LOOK ('up' or 'down')
+        max_workers: Number of worker processes (default: one per algorithm)
+    
+    Returns:
+        Dictionary mapping each name in DISK_ALGORITHMS to its
+        (head_movement_sequence, total_seek_time, statistics) tuple
+    """
+    # Plain tuples pickle much faster than DiskRequest objects
+    request_fields = [(r.request_id, r.track_number, r.arrival_time) for r in requests]
+    with ProcessPoolExecutor(max_workers=max_workers or len(DISK_ALGORITHMS)) as executor:
+        futures = {
+            algorithm: executor.submit(_run_disk_scheduler, algorithm, request_fields,
+                                       initial_head_position, disk_size, direction)
+            for algorithm in DISK_ALGORITHMS
+        }
+        return {algorithm: future.result() for algorithm, future in futures.items()}
@@ -9,11 +9,18 @@ This module provides the core scheduling logic for:
 - Priority Scheduling
 """
 
+from collections import deque
+from heapq import heappop, heappush
+
 class Process:
     """
     Process class to represent a single process in the system.
     Contains all necessary information for scheduling simulation.
     """
+    __slots__ = ('pid', 'arrival_time', 'burst_time', 'remaining_time', 'priority',
+                 'completion_time', 'turnaround_time', 'waiting_time',
+                 'response_time', 'start_time')
+
     def __init__(self, pid, arrival_time, burst_time, priority):
         self.pid = pid
         self.arrival_time = arrival_time
@@ -26,7 +33,37 @@ class Process:
         self.response_time = -1  # -1 indicates not started yet
         self.start_time = -1
 
-def first_come_first_serve(processes):
+class _ProcessState:
+    """
+    Timing results of one process during a single scheduling run, kept apart
+    from the Process so the caller's objects are left untouched.
+    """
+    __slots__ = ('remaining_time', 'start_time', 'response_time',
+                 'completion_time', 'turnaround_time', 'waiting_time')
+
+    def __init__(self, burst_time):
+        self.remaining_time = burst_time
+        self.start_time = -1
+        self.response_time = -1
+        self.completion_time = 0
+        self.turnaround_time = 0
+        self.waiting_time = 0
+
+def _fill_derived_times(processes, states):
+    """
+    Fill in turnaround and waiting times once scheduling has finished. Both
+    depend only on completion time and the fixed arrival and burst times, so
+    the scheduling loops record the completion time alone.
+    
+    Args:
+        processes: Process objects supplying arrival and burst times
+        states: Objects holding each process's results, in the same order
+    """
+    for p, state in zip(processes, states):
+        state.turnaround_time = turnaround = state.completion_time - p.arrival_time
+        state.waiting_time = turnaround - p.burst_time
+
+def first_come_first_serve(processes, presorted=False):
     """
     First Come First Serve (FCFS) Scheduling Algorithm
     
@@ -34,7 +71,9 @@ def first_come_first_serve(processes):
     Simple but can cause convoy effect with long processes.
     
     Args:
-        processes: List of Process objects
+        processes: List of Process objects (their timing fields are filled in)
+        presorted: True if processes are already ordered by (arrival_time, pid),
+                   which skips the sort
     
     Returns:
         Tuple containing (execution_timeline, statistics)
@@ -43,7 +82,10 @@ def first_come_first_serve(processes):
         return [], {}
     
     # Sort processes by arrival time, then by PID for deterministic results
-    processes_sorted = sorted(processes, key=lambda p: (p.arrival_time, p.pid))
+    if presorted:
+        processes_sorted = processes
+    else:
+        processes_sorted = sorted(processes, key=lambda p: (p.arrival_time, p.pid))
     
     current_time = 0
     execution_timeline = []
@@ -67,11 +109,10 @@ def first_come_first_serve(processes):
         
         current_time += process.burst_time
         
-        # Calculate completion and derived times
+        # Record completion; turnaround and waiting are filled in after the loop
         process.completion_time = current_time
-        process.turnaround_time = process.completion_time - process.arrival_time
-        process.waiting_time = process.turnaround_time - process.burst_time
     
+    _fill_derived_times(processes_sorted, processes_sorted)
     statistics = calculate_statistics(processes_sorted)
     return execution_timeline, statistics
 
@@ -91,26 +132,32 @@ def shortest_job_first(processes):
     if not processes:
         return [], {}
     
-    processes_copy = [Process(p.pid, p.arrival_time, p.burst_time, p.priority) for p in processes]
-    ready_queue = []
-    completed = []
+    # Processes in arrival order; everything before next_arrival has been admitted
+    arrivals = sorted(processes, key=lambda p: (p.arrival_time, p.pid))
+    next_arrival = 0
+    ready_queue = []  # Heap of (burst_time, pid, admission index, process)
+    # Results for each process, indexed like arrivals
+    states = [_ProcessState(p.burst_time) for p in arrivals]
+    num_completed = 0
     current_time = 0
     execution_timeline = []
     
-    while len(completed) < len(processes_copy):
+    while num_completed < len(processes):
         # Add newly arrived processes to ready queue
-        for process in processes_copy:
-            if process.arrival_time <= current_time and process not in ready_queue and process not in completed:
-                ready_queue.append(process)
+        while next_arrival < len(arrivals) and arrivals[next_arrival].arrival_time <= current_time:
+            process = arrivals[next_arrival]
+            # next_arrival breaks remaining ties in admission order
+            heappush(ready_queue, (process.burst_time, process.pid, next_arrival, process))
+            next_arrival += 1
         
         if ready_queue:
             # Select process with shortest burst time (SJF)
-            selected_process = min(ready_queue, key=lambda p: (p.burst_time, p.pid))
-            ready_queue.remove(selected_process)
+            _, _, index, selected_process = heappop(ready_queue)
+            state = states[index]
             
             # Set timing information
-            selected_process.start_time = current_time
-            selected_process.response_time = current_time - selected_process.arrival_time
+            state.start_time = current_time
+            state.response_time = current_time - selected_process.arrival_time
             
             # Execute the process
             execution_timeline.append({
@@ -123,16 +170,14 @@ def shortest_job_first(processes):
             current_time += selected_process.burst_time
             
             # Complete the process
-            selected_process.completion_time = current_time
-            selected_process.turnaround_time = selected_process.completion_time - selected_process.arrival_time
-            selected_process.waiting_time = selected_process.turnaround_time - selected_process.burst_time
-            completed.append(selected_process)
+            state.completion_time = current_time
+            num_completed += 1
         else:
             # No process ready, advance time to next arrival
-            next_arrival = min([p.arrival_time for p in processes_copy if p not in completed])
-            current_time = next_arrival
+            current_time = arrivals[next_arrival].arrival_time
     
-    statistics = calculate_statistics(completed)
+    _fill_derived_times(arrivals, states)
+    statistics = calculate_statistics(states)
     return execution_timeline, statistics
 
 def round_robin(processes, quantum=3):
@@ -152,36 +197,52 @@ def round_robin(processes, quantum=3):
     if not processes:
         return [], {}
     
-    processes_copy = [Process(p.pid, p.arrival_time, p.burst_time, p.priority) for p in processes]
-    ready_queue = []
-    completed = []
+    # Processes in arrival order; everything before next_arrival has been admitted.
+    # The sort is stable, so processes arriving together keep their input order
+    arrivals = sorted(processes, key=lambda p: p.arrival_time)
+    next_arrival = 0
+    ready_queue = deque()  # Indices into arrivals
+    # Results for each process, indexed like arrivals
+    states = [_ProcessState(p.burst_time) for p in arrivals]
+    num_completed = 0
     current_time = 0
     execution_timeline = []
     
-    # Add initially ready processes
-    for process in processes_copy:
-        if process.arrival_time == 0:
-            ready_queue.append(process)
-    
-    while len(completed) < len(processes_copy):
-        # Add newly arrived processes to ready queue
-        for process in processes_copy:
-            if (process.arrival_time <= current_time and 
-                process not in ready_queue and 
-                process not in completed and 
-                process.remaining_time > 0):
-                ready_queue.append(process)
+    while num_completed < len(processes):
+        # Add newly arrived processes to ready queue, behind any process
+        # that was just preempted
+        while next_arrival < len(arrivals) and arrivals[next_arrival].arrival_time <= current_time:
+            ready_queue.append(next_arrival)
+            next_arrival += 1
         
         if ready_queue:
-            current_process = ready_queue.pop(0)  # Get first process in queue
+            index = ready_queue.popleft()  # Get first process in queue
+            current_process = arrivals[index]
+            state = states[index]
             
             # Set response time on first execution
-            if current_process.response_time == -1:
-                current_process.response_time = current_time - current_process.arrival_time
-                current_process.start_time = current_time
+            if state.response_time == -1:
+                state.response_time = current_time - current_process.arrival_time
+                state.start_time = current_time
+            
+            # With nothing else ready, the process would be re-queued and picked
+            # again after each full quantum until another process arrives, so run
+            # those quanta back to back without going through the queue
+            if not ready_queue:
+                next_arrival_time = arrivals[next_arrival].arrival_time if next_arrival < len(arrivals) else None
+                while (state.remaining_time > quantum and
+                       (next_arrival_time is None or current_time + quantum < next_arrival_time)):
+                    execution_timeline.append({
+                        'pid': current_process.pid,
+                        'start': current_time,
+                        'end': current_time + quantum,
+                        'duration': quantum
+                    })
+                    current_time += quantum
+                    state.remaining_time -= quantum
             
             # Determine execution time (quantum or remaining time)
-            execution_time = min(quantum, current_process.remaining_time)
+            execution_time = min(quantum, state.remaining_time)
             
             # Execute for the determined time
             execution_timeline.append({
@@ -192,25 +253,21 @@ def round_robin(processes, quantum=3):
             })
             
             current_time += execution_time
-            current_process.remaining_time -= execution_time
+            state.remaining_time -= execution_time
             
             # Check if process is complete
-            if current_process.remaining_time == 0:
-                current_process.completion_time = current_time
-                current_process.turnaround_time = current_process.completion_time - current_process.arrival_time
-                current_process.waiting_time = current_process.turnaround_time - current_process.burst_time
-                completed.append(current_process)
+            if state.remaining_time == 0:
+                state.completion_time = current_time
+                num_completed += 1
             else:
                 # Process not complete, add back to ready queue
-                ready_queue.append(current_process)
+                ready_queue.append(index)
         else:
             # No process ready, advance time to next arrival
-            next_arrivals = [p.arrival_time for p in processes_copy 
-                           if p.arrival_time > current_time and p not in completed]
-            if next_arrivals:
-                current_time = min(next_arrivals)
+            current_time = arrivals[next_arrival].arrival_time
     
-    statistics = calculate_statistics(completed)
+    _fill_derived_times(arrivals, states)
+    statistics = calculate_statistics(states)
     return execution_timeline, statistics
 
 def priority_scheduling(processes):
@@ -229,26 +286,32 @@ def priority_scheduling(processes):
     if not processes:
         return [], {}
     
-    processes_copy = [Process(p.pid, p.arrival_time, p.burst_time, p.priority) for p in processes]
-    ready_queue = []
-    completed = []
+    # Processes in arrival order; everything before next_arrival has been admitted
+    arrivals = sorted(processes, key=lambda p: (p.arrival_time, p.pid))
+    next_arrival = 0
+    ready_queue = []  # Heap of (priority, pid, admission index, process)
+    # Results for each process, indexed like arrivals
+    states = [_ProcessState(p.burst_time) for p in arrivals]
+    num_completed = 0
     current_time = 0
     execution_timeline = []
     
-    while len(completed) < len(processes_copy):
+    while num_completed < len(processes):
         # Add newly arrived processes to ready queue
-        for process in processes_copy:
-            if process.arrival_time <= current_time and process not in ready_queue and process not in completed:
-                ready_queue.append(process)
+        while next_arrival < len(arrivals) and arrivals[next_arrival].arrival_time <= current_time:
+            process = arrivals[next_arrival]
+            # next_arrival breaks remaining ties in admission order
+            heappush(ready_queue, (process.priority, process.pid, next_arrival, process))
+            next_arrival += 1
         
         if ready_queue:
             # Select process with highest priority (lowest priority number)
-            selected_process = min(ready_queue, key=lambda p: (p.priority, p.pid))
-            ready_queue.remove(selected_process)
+            _, _, index, selected_process = heappop(ready_queue)
+            state = states[index]
             
             # Set timing information
-            selected_process.start_time = current_time
-            selected_process.response_time = current_time - selected_process.arrival_time
+            state.start_time = current_time
+            state.response_time = current_time - selected_process.arrival_time
             
             # Execute the process
             execution_timeline.append({
@@ -261,16 +324,14 @@ def priority_scheduling(processes):
             current_time += selected_process.burst_time
             
             # Complete the process
-            selected_process.completion_time = current_time
-            selected_process.turnaround_time = selected_process.completion_time - selected_process.arrival_time
-            selected_process.waiting_time = selected_process.turnaround_time - selected_process.burst_time
-            completed.append(selected_process)
+            state.completion_time = current_time
+            num_completed += 1
         else:
             # No process ready, advance time to next arrival
-            next_arrival = min([p.arrival_time for p in processes_copy if p not in completed])
-            current_time = next_arrival
+            current_time = arrivals[next_arrival].arrival_time
     
-    statistics = calculate_statistics(completed)
+    _fill_derived_times(arrivals, states)
+    statistics = calculate_statistics(states)
     return execution_timeline, statistics
 
 def calculate_statistics(processes):
@@ -278,7 +339,8 @@ def calculate_statistics(processes):
     Calculate scheduling statistics for the completed processes.
     
     Args:
-        processes: List of completed Process objects
+        processes: Completed Process objects, or the per-run states holding
+                   their results
     
     Returns:
         Dictionary containing average statistics
@@ -292,15 +354,21 @@ def calculate_statistics(processes):
             'throughput': 0
         }
     
-    total_turnaround = sum(p.turnaround_time for p in processes)
-    total_waiting = sum(p.waiting_time for p in processes)
-    total_response = sum(p.response_time for p in processes)
-    total_time = max(p.completion_time for p in processes) if processes else 0
+    # Gather every total in a single pass over the processes
+    total_turnaround = total_waiting = total_response = 0
+    total_time = processes[0].completion_time
+    for p in processes:
+        total_turnaround += p.turnaround_time
+        total_waiting += p.waiting_time
+        total_response += p.response_time
+        if p.completion_time > total_time:
+            total_time = p.completion_time
     
+    count = len(processes)
     return {
-        'avg_turnaround_time': round(total_turnaround / len(processes), 2),
-        'avg_waiting_time': round(total_waiting / len(processes), 2),
-        'avg_response_time': round(total_response / len(processes), 2),
+        'avg_turnaround_time': round(total_turnaround / count, 2),
+        'avg_waiting_time': round(total_waiting / count, 2),
+        'avg_response_time': round(total_response / count, 2),
         'total_time': total_time,
-        'throughput': round(len(processes) / total_time, 2) if total_time > 0 else 0
+        'throughput': round(count / total_time, 2) if total_time > 0 else 0
     }
\ No newline at end of file
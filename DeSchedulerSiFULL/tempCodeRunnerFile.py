@@ -235,7 +235,6 @@ def simulate_disk_scheduling():
     Accepts algorithm type and returns head movement sequence and statistics.
     """
     try:
-        print("!!!!!!!!!! RUNNING THE NEWEST CODE !!!!!!!!!") 
         data = request.get_json()
         algorithm = data.get('algorithm', 'fcfs')
         initial_head_position = data.get('initial_head_position', 50)
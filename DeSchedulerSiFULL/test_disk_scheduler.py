@@ -0,0 +1,79 @@
+import unittest
+
+from disk_scheduler import DiskRequest, scan_disk_scheduling, sstf_disk_scheduling
+
+
+def make_requests(rows):
+    return [DiskRequest(request_id, track_number, arrival_time)
+            for request_id, track_number, arrival_time in rows]
+
+
+def service_order(head_movements):
+    return [movement['request'] for movement in head_movements[1:]]
+
+
+class ScanTieOrderTest(unittest.TestCase):
+    """SCAN serves requests on the same track in input order after reversing."""
+
+    def test_reversal_onto_track_with_later_arrival(self):
+        requests = make_requests([(1, 2, 0), (2, 2, 0), (3, 2, 1)])
+        head_movements, total_seek_time, _ = scan_disk_scheduling(requests, 3, 200, 'up')
+        self.assertEqual(service_order(head_movements), [1, 2, 3])
+        self.assertEqual([m['time'] for m in head_movements], [0, 1, 2, 3])
+        self.assertEqual(total_seek_time, 1)
+
+    def test_reversal_then_sweep_back_up(self):
+        requests = make_requests([(1, 5, 0), (2, 1, 0), (3, 5, 0), (4, 5, 2), (5, 9, 3)])
+        head_movements, total_seek_time, _ = scan_disk_scheduling(requests, 7, 200, 'up')
+        self.assertEqual(service_order(head_movements), [1, 3, 4, 2, 5])
+        self.assertEqual([m['time'] for m in head_movements], [0, 2, 3, 4, 8, 16])
+        self.assertEqual(total_seek_time, 14)
+
+
+class SstfStarvationThresholdTest(unittest.TestCase):
+    """A request waiting longer than the threshold is serviced next, oldest first."""
+
+    def test_expired_request_served_ahead_of_closer_one(self):
+        rows = [(1, 150, 0), (2, 55, 0), (3, 60, 0), (4, 65, 0)]
+        head_movements, _, _ = sstf_disk_scheduling(make_requests(rows), 50)
+        self.assertEqual(service_order(head_movements), [2, 3, 4, 1])
+
+        # Request 1 has waited 10 > 7 by the time request 3 is done
+        head_movements, total_seek_time, _ = sstf_disk_scheduling(make_requests(rows), 50,
+                                                                  starvation_threshold=7)
+        self.assertEqual(service_order(head_movements), [2, 3, 1, 4])
+        self.assertEqual([m['time'] for m in head_movements], [0, 5, 10, 100, 185])
+        self.assertEqual(total_seek_time, 185)
+
+        # Waiting exactly the threshold is not yet too long
+        head_movements, _, _ = sstf_disk_scheduling(make_requests(rows), 50, starvation_threshold=10)
+        self.assertEqual(service_order(head_movements), [2, 3, 4, 1])
+
+    def test_expired_requests_served_oldest_first(self):
+        # Both 1 and 2 have expired once request 3 is done; 2 is closer but younger
+        rows = [(1, 0, 0), (2, 90, 1), (3, 60, 0)]
+        head_movements, _, _ = sstf_disk_scheduling(make_requests(rows), 50)
+        self.assertEqual(service_order(head_movements), [3, 2, 1])
+
+        head_movements, total_seek_time, _ = sstf_disk_scheduling(make_requests(rows), 50,
+                                                                  starvation_threshold=5)
+        self.assertEqual(service_order(head_movements), [3, 1, 2])
+        self.assertEqual([m['time'] for m in head_movements], [0, 10, 70, 160])
+        self.assertEqual(total_seek_time, 160)
+
+    def test_no_threshold_matches_plain_sstf(self):
+        staggered = [(1, 98, 0), (2, 183, 0), (3, 37, 2), (4, 122, 5),
+                     (5, 14, 5), (6, 124, 7), (7, 65, 9), (8, 67, 9)]
+        # All arrivals at time 0 take the static-batch path
+        static = [(request_id, track, 0) for request_id, track, _ in staggered]
+        for rows, expected in [(staggered, [1, 4, 6, 8, 7, 3, 5, 2]),
+                               (static, [7, 8, 3, 5, 1, 4, 6, 2])]:
+            plain = sstf_disk_scheduling(make_requests(rows), 53)
+            self.assertEqual(service_order(plain[0]), expected)
+            self.assertEqual(sstf_disk_scheduling(make_requests(rows), 53, starvation_threshold=None), plain)
+            # A threshold that never triggers runs the general loop to the same result
+            self.assertEqual(sstf_disk_scheduling(make_requests(rows), 53, starvation_threshold=10**9), plain)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,25 @@
+import unittest
+
+from scheduler import Process, round_robin
+
+
+def run_order(execution_timeline):
+    return [entry['pid'] for entry in execution_timeline]
+
+
+class RoundRobinTieOrderTest(unittest.TestCase):
+    """Processes arriving at the same time join the queue in input order."""
+
+    def test_simultaneous_arrivals_keep_input_order(self):
+        processes = [Process(5, 0, 4, 1), Process(2, 0, 4, 1)]
+        execution_timeline, _ = round_robin(processes, 2)
+        self.assertEqual(run_order(execution_timeline), [5, 2, 5, 2])
+
+    def test_later_simultaneous_arrivals_keep_input_order(self):
+        processes = [Process(1, 0, 2, 1), Process(9, 1, 4, 1), Process(4, 1, 4, 1)]
+        execution_timeline, _ = round_robin(processes, 2)
+        self.assertEqual(run_order(execution_timeline), [1, 9, 4, 9, 4])
+
+
+if __name__ == '__main__':
+    unittest.main()